@@ -10,9 +10,17 @@ Date: [Current Date]
 """
 
 import json
+import math
 import sys
 import os
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder.
+    orjson = None
+
 if hasattr(sys.stdout, "reconfigure"):
     sys.stdout.reconfigure(encoding="utf-8")
     sys.stderr.reconfigure(encoding="utf-8")
@@ -26,19 +34,18 @@ from gnss_frequencies import (
     calculate_subdaily_aliasing,
     cpd_to_days,
     days_to_cpd,
-    get_frequency_summary
+    flatten_frequencies,
+    get_frequency_summary,
+    unfreeze_frequencies
 )
 
 
-def example_1_basic_frequency_access():
+def example_1_basic_frequency_access(frequencies):
     """Example 1: Basic frequency access and conversion."""
     print("=" * 60)
     print("EXAMPLE 1: Basic Frequency Access")
     print("=" * 60)
 
-    # Create the frequency database
-    frequencies = create_gnss_frequencies()
-
     # Access GPS frequencies
     gps = frequencies['gps']
     print(f"GPS orbital frequency: {gps['orbital_frequency']:.7f} cpd")
@@ -84,12 +91,17 @@ def example_2_orbital_calculations():
     print("n   m   Description                          Period (hrs)   Period (days)   Freq (cpd)")
     print("-" * 85)
 
+    row_fmt = "%2d  %2d  %-30s  %8.3f    %8.3f     %8.5f"
+    lines = []
     for n, m, description in test_cases:
         period_hrs = calculate_orbital_period(n, m, T_S_GPS, T_E)
-        if period_hrs != float('inf'):
+        if period_hrs != math.inf:
             period_days = period_hrs / 24.0
             freq_cpd = 24.0 / period_hrs
-            print(f"{n:2d}  {m:2d}  {description:<30s}  {period_hrs:8.3f}    {period_days:8.3f}     {freq_cpd:8.5f}")
+            lines.append(row_fmt % (n, m, description, period_hrs, period_days, freq_cpd))
+
+    if lines:
+        print("\n".join(lines))
 
 
 def example_3_aliasing_analysis():
@@ -111,21 +123,23 @@ def example_3_aliasing_analysis():
     print("Original Freq (cpd)  Description                 Aliased Freq (cpd)  Aliased Period (days)")
     print("-" * 90)
 
+    row_fmt = "%12.7f     %-25s  %12.7f     %12.3f"
+    lines = []
     for freq, description in test_frequencies:
         aliased_freq = calculate_subdaily_aliasing(freq, 24)
-        aliased_period = cpd_to_days(aliased_freq) if aliased_freq > 0 else float('inf')
+        aliased_period = cpd_to_days(aliased_freq) if aliased_freq > 0 else math.inf
 
-        print(f"{freq:12.7f}     {description:<25s}  {aliased_freq:12.7f}     {aliased_period:12.3f}")
+        lines.append(row_fmt % (freq, description, aliased_freq, aliased_period))
 
+    print("\n".join(lines))
 
-def example_4_constellation_comparison():
+
+def example_4_constellation_comparison(frequencies):
     """Example 4: Compare frequencies across constellations."""
     print("\n" + "=" * 60)
     print("EXAMPLE 4: Multi-GNSS Constellation Comparison")
     print("=" * 60)
 
-    frequencies = create_gnss_frequencies()
-
     constellations = ['gps', 'glonass', 'galileo', 'bds_3_meo']
     parameters = ['orbital_frequency', 'draconitic_frequency', 'ground_repeat_frequency']
 
@@ -133,33 +147,44 @@ def example_4_constellation_comparison():
     print("Parameter                    GPS        GLONASS     Galileo     BDS-3 MEO  Units")
     print("-" * 82)
 
+    # Transpose into per-parameter rows so formatting walks plain lists
+    # instead of chained dict lookups per cell
+    matrix = {
+        param: [frequencies[const].get(param) for const in constellations]
+        for param in parameters
+    }
+
+    lines = []
     for param in parameters:
-        print(f"{param:<25s}", end="")
-        for const in constellations:
-            if param in frequencies[const]:
-                freq = frequencies[const][param]
-                print(f"{freq:10.7f} ", end="")
+        cells = [f"{param:<25s}"]
+        for freq in matrix[param]:
+            if freq is not None:
+                cells.append(f"{freq:10.7f} ")
             else:
-                print(f"{'N/A':>10s} ", end="")
-        print("cpd")
+                cells.append(f"{'N/A':>10s} ")
+        cells.append("cpd")
+        lines.append("".join(cells))
 
     # Compare draconitic periods
-    print(f"\n{'Draconitic periods:':<25s}", end="")
-    for const in constellations:
-        freq = frequencies[const]['draconitic_frequency']
-        period = cpd_to_days(freq)
-        print(f"{period:10.1f} ", end="")
-    print("days")
+    draconitic_periods = [
+        cpd_to_days(frequencies[const]['draconitic_frequency']) for const in constellations
+    ]
+    cells = [f"{'Draconitic periods:':<25s}"]
+    for period in draconitic_periods:
+        cells.append(f"{period:10.1f} ")
+    cells.append("days")
+    lines.append("")
+    lines.append("".join(cells))
+
+    print("\n".join(lines))
 
 
-def example_5_frequency_search():
+def example_5_frequency_search(frequencies):
     """Example 5: Search for frequencies in specific ranges."""
     print("\n" + "=" * 60)
     print("EXAMPLE 5: Frequency Range Search")
     print("=" * 60)
 
-    frequencies = create_gnss_frequencies()
-
     # Define search ranges
     search_ranges = [
         (0.0, 0.1, "Long-period signals (>10 days)"),
@@ -168,41 +193,39 @@ def example_5_frequency_search():
         (0.02, 0.05, "Monthly signals")
     ]
 
-    def find_frequencies_in_range(freq_dict, min_freq, max_freq, prefix=""):
-        """Recursively find frequencies in a given range."""
-        results = []
-        for key, value in freq_dict.items():
-            current_path = f"{prefix}.{key}" if prefix else key
-            if isinstance(value, dict):
-                results.extend(find_frequencies_in_range(value, min_freq, max_freq, current_path))
-            elif isinstance(value, (int, float)) and min_freq <= value <= max_freq:
-                results.append((current_path, value))
-        return results
+    # Flatten the tree once; each range query is then a binary search
+    names, freqs = flatten_frequencies(frequencies)
 
     for min_freq, max_freq, description in search_ranges:
         print(f"\n{description} ({min_freq}-{max_freq} cpd):")
-        results = find_frequencies_in_range(frequencies, min_freq, max_freq)
+        lo = np.searchsorted(freqs, min_freq, side='left')
+        hi = np.searchsorted(freqs, max_freq, side='right')
 
-        if results:
-            for name, freq in sorted(results, key=lambda x: x[1]):
+        if lo < hi:
+            for name, freq in zip(names[lo:hi], freqs[lo:hi]):
                 period = cpd_to_days(freq)
                 print(f"  {name:<40s}: {freq:8.5f} cpd ({period:8.2f} days)")
         else:
             print("  No frequencies found in this range")
 
 
-def example_6_json_export_import():
+def example_6_json_export_import(frequencies):
     """Example 6: Working with JSON export/import."""
     print("\n" + "=" * 60)
     print("EXAMPLE 6: JSON Export and Import")
     print("=" * 60)
 
-    # Create frequencies and save to JSON
-    frequencies = create_gnss_frequencies()
-
     filename = "example_frequencies.json"
-    with open(filename, 'w') as f:
-        json.dump(frequencies, f, indent=2)
+    plain_frequencies = unfreeze_frequencies(frequencies)
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: the harmonic sub-dicts are keyed by int
+        payload = orjson.dumps(
+            plain_frequencies, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    else:
+        payload = json.dumps(plain_frequencies, indent=2).encode()
+    with open(filename, 'wb') as f:
+        f.write(payload)
 
     print(f"Frequencies saved to {filename}")
 
@@ -255,13 +278,16 @@ def main():
     print("GNSS Frequencies Library - Usage Examples")
     print("=" * 60)
 
+    # Build the frequency database once and share it across the examples
+    frequencies = create_gnss_frequencies()
+
     # Run all examples
-    example_1_basic_frequency_access()
+    example_1_basic_frequency_access(frequencies)
     example_2_orbital_calculations()
     example_3_aliasing_analysis()
-    example_4_constellation_comparison()
-    example_5_frequency_search()
-    example_6_json_export_import()
+    example_4_constellation_comparison(frequencies)
+    example_5_frequency_search(frequencies)
+    example_6_json_export_import(frequencies)
     example_7_summary_statistics()
 
     print("\n" + "=" * 60)
@@ -5,10 +5,24 @@ A library for calculating and analyzing GNSS frequencies, orbital signals,
 and tidal frequencies.
 """
 
+import functools
 import json
 import math
+import operator
+import types
+from collections.abc import Mapping
 from pathlib import Path
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to the pure-Python loop.
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
 
 SECONDS_PER_DAY = 86400.0
 EARTH_GRAVITATIONAL_PARAMETER_KM3_S2 = 398600.4418
@@ -39,20 +53,74 @@ ORBITAL_SIGNAL_COMBINATIONS = [
 ]
 
 
+def _freeze_mapping(mapping):
+    """Recursively wrap a dict tree in read-only MappingProxyType views."""
+    frozen = {
+        key: _freeze_mapping(value) if isinstance(value, Mapping) else value
+        for key, value in mapping.items()
+    }
+    return types.MappingProxyType(frozen)
+
+
+def unfreeze_frequencies(frequencies):
+    """Deep-copy a frozen frequencies mapping back into plain mutable dicts."""
+    return {
+        key: unfreeze_frequencies(value) if isinstance(value, Mapping) else value
+        for key, value in frequencies.items()
+    }
+
+
+_FLATTEN_CACHE = {}
+
+
+def flatten_frequencies(freq_dict):
+    """
+    Flatten a nested frequencies mapping into parallel (names, frequencies).
+
+    Returns a list of dotted-path names and a NumPy array of the matching
+    values, both ordered by ascending frequency, so range queries can use
+    binary search instead of re-walking the tree. The result is cached per
+    mapping instance.
+    """
+    cached = _FLATTEN_CACHE.get(id(freq_dict))
+    if cached is not None:
+        return cached
+
+    entries = []
+
+    def _walk(data, prefix):
+        for key, value in data.items():
+            path = f"{prefix}.{key}" if prefix else str(key)
+            if isinstance(value, Mapping):
+                _walk(value, path)
+            elif isinstance(value, (int, float)):
+                entries.append((path, value))
+
+    _walk(freq_dict, "")
+    entries.sort(key=operator.itemgetter(1))
+    names = [path for path, _ in entries]
+    freqs = np.array([value for _, value in entries], dtype=np.float64)
+    _FLATTEN_CACHE[id(freq_dict)] = (names, freqs)
+    return names, freqs
+
+
+@functools.lru_cache(maxsize=512)
 def cpd_to_days(frequency_cpd):
     """Convert a frequency in cycles per day to a period in days."""
     if frequency_cpd == 0:
-        return float("inf")
+        return math.inf
     return 1.0 / frequency_cpd
 
 
+@functools.lru_cache(maxsize=512)
 def days_to_cpd(period_days):
     """Convert a period in days to a frequency in cycles per day."""
     if period_days == 0:
-        return float("inf")
+        return math.inf
     return 1.0 / period_days
 
 
+@functools.lru_cache(maxsize=512)
 def calculate_alias_frequency(freq, reference_freq):
     """Calculate an aliased frequency with respect to a reference frequency."""
     if reference_freq == 0:
@@ -61,46 +129,91 @@ def calculate_alias_frequency(freq, reference_freq):
     return abs(freq - round(ratio) * reference_freq)
 
 
+@functools.lru_cache(maxsize=512)
 def calculate_subdaily_aliasing(freq_cpd, sampling_interval_hours=24):
     """Calculate aliased subdaily frequency using the Zajdel et al. formulation."""
+    if sampling_interval_hours == 24:
+        # Daily sampling: the formula degenerates to the distance from the
+        # nearest whole number of cycles per day.
+        return abs(freq_cpd - round(freq_cpd))
     sample_period_days = sampling_interval_hours / 24.0
-    return abs(freq_cpd - (1 / sample_period_days) * math.floor(freq_cpd * sample_period_days + 0.5))
+    step = 1.0 / sample_period_days
+    return abs(freq_cpd - step * int(freq_cpd * sample_period_days + 0.5))
 
 
+@functools.lru_cache(maxsize=512)
 def calculate_orbital_period(n, m, T_S, T_E):
     """Calculate orbital period using equation (7) from Zajdel et al. (2022)."""
-    if n == 0 and m == 0:
-        return float("inf")
+    denominator = abs(n / T_E + m / T_S)
+    if denominator < 1e-10:
+        return math.inf
+
+    return 1.0 / denominator
 
-    denominator = n / T_E + m / T_S
-    if abs(denominator) < 1e-10:
-        return float("inf")
 
-    return abs(1.0 / denominator)
+def make_orbital_period_fn(T_S, T_E):
+    """
+    Return calculate_orbital_period specialized for a fixed (T_S, T_E) pair.
+
+    The reciprocals are baked into the closure, so each evaluation costs two
+    multiplies and an add instead of two divisions through the generic path.
+    """
+    inv_T_E = 1.0 / T_E
+    inv_T_S = 1.0 / T_S
+
+    def orbital_period(n, m):
+        denominator = abs(n * inv_T_E + m * inv_T_S)
+        if denominator < 1e-10:
+            return math.inf
+        return 1.0 / denominator
+
+    return orbital_period
 
 
 def calculate_draconitic_harmonics(base_freq, max_harmonic=12):
     """Calculate draconitic frequency harmonics."""
-    return {i: i * base_freq for i in range(1, max_harmonic + 1)}
+    harmonics = np.arange(1, max_harmonic + 1, dtype=np.float64) * base_freq
+    return dict(zip(range(1, max_harmonic + 1), harmonics.tolist()))
+
+
+@njit(cache=True)
+def _orbital_peak_aliases(sun_arg_lat_freq, draconitic_freq, min_coeff, max_coeff):
+    """Numeric kernel for calculate_orbital_peaks (kept module-level for JIT reuse)."""
+    aliases = np.empty(4 * (max_coeff - min_coeff), dtype=np.float64)
+    index = 0
+    for m in range(1, 5):
+        base_freq = m * sun_arg_lat_freq
+        for k in range(min_coeff, max_coeff):
+            combined_freq = base_freq + k * draconitic_freq
+            aliases[index] = abs(combined_freq - round(combined_freq))
+            index += 1
+    return aliases
 
 
 def calculate_orbital_peaks(sun_arg_lat_freq, draconitic_freq, harmonics_range=(-4, 5)):
     """Calculate Rebischung-style orbital peak combinations."""
-    peaks = {"all_peaks": {}}
     min_coeff, max_coeff = harmonics_range
+    aliases = _orbital_peak_aliases(
+        float(sun_arg_lat_freq), float(draconitic_freq), min_coeff, max_coeff
+    )
 
+    all_peaks = {}
+    index = 0
     for m in range(1, 5):
-        base_freq = m * sun_arg_lat_freq
         for k in range(min_coeff, max_coeff):
-            combined_freq = base_freq + k * draconitic_freq
-            peaks["all_peaks"][f"{m:+d}f_u{k:+d}f_d"] = abs(combined_freq - round(combined_freq))
+            all_peaks[f"{m:+d}f_u{k:+d}f_d"] = float(aliases[index])
+            index += 1
 
-    return peaks
+    # Sort once at construction so display and export code can rely on
+    # insertion order instead of re-sorting per run.
+    all_peaks = dict(sorted(all_peaks.items(), key=operator.itemgetter(1)))
+    return {"all_peaks": all_peaks}
 
 
 def calculate_annual_harmonics(base_freq, max_harmonic=12):
     """Calculate annual frequency harmonics."""
-    return {i: i * base_freq for i in range(1, max_harmonic + 1)}
+    harmonics = np.arange(1, max_harmonic + 1, dtype=np.float64) * base_freq
+    return dict(zip(range(1, max_harmonic + 1), harmonics.tolist()))
 
 
 def load_constellation_definitions(config_path=CONSTELLATION_CONFIG_PATH):
@@ -148,24 +261,42 @@ def calculate_constellation_dynamics(semi_major_axis_km, eccentricity, inclinati
 
 
 def calculate_orbital_signals_table(revolution_periods_hours):
-    """Calculate orbital signals and their aliasing periods for each constellation."""
+    """
+    Calculate orbital signals and their aliasing periods for each constellation.
+
+    All (constellation, n, m) combinations are evaluated with a single NumPy
+    broadcast instead of one Python-level calculation per pair.
+    """
     earth_rotation_period_hours = 23.9345
-    orbital_signals = {}
+    nm = np.array(ORBITAL_SIGNAL_COMBINATIONS, dtype=np.float64)
+    revolution_periods = np.fromiter(
+        revolution_periods_hours.values(), dtype=np.float64
+    )[:, np.newaxis]
+
+    with np.errstate(divide="ignore"):
+        denominators = nm[:, 0] * (1.0 / earth_rotation_period_hours) + nm[:, 1] * (1.0 / revolution_periods)
+        orbital_periods_hours = np.where(
+            np.abs(denominators) < 1e-10, np.inf, np.abs(1.0 / denominators)
+        )
+        frequencies_cpd = 24.0 / orbital_periods_hours
+        aliased_frequencies_cpd = np.abs(frequencies_cpd - np.rint(frequencies_cpd))
+        aliased_periods_days = np.where(
+            aliased_frequencies_cpd == 0.0, np.inf, 1.0 / aliased_frequencies_cpd
+        )
 
-    for constellation, revolution_period_hours in revolution_periods_hours.items():
+    orbital_signals = {}
+    for row, constellation in enumerate(revolution_periods_hours):
         signals = {}
-        for n, m in ORBITAL_SIGNAL_COMBINATIONS:
-            orbital_period_hours = calculate_orbital_period(n, m, revolution_period_hours, earth_rotation_period_hours)
-            if orbital_period_hours == float("inf") or orbital_period_hours <= 0:
+        for col, (n, m) in enumerate(ORBITAL_SIGNAL_COMBINATIONS):
+            orbital_period_hours = orbital_periods_hours[row, col]
+            if np.isinf(orbital_period_hours) or orbital_period_hours <= 0:
                 continue
 
-            frequency_cpd = 24.0 / orbital_period_hours
-            aliased_frequency_cpd = calculate_subdaily_aliasing(frequency_cpd, 24)
             signals[f"n{n}_m{m}"] = {
-                "orbital_period_hours": orbital_period_hours,
-                "frequency_cpd": frequency_cpd,
-                "aliased_frequency_cpd": aliased_frequency_cpd,
-                "aliased_period_days": cpd_to_days(aliased_frequency_cpd),
+                "orbital_period_hours": float(orbital_period_hours),
+                "frequency_cpd": float(frequencies_cpd[row, col]),
+                "aliased_frequency_cpd": float(aliased_frequencies_cpd[row, col]),
+                "aliased_period_days": float(aliased_periods_days[row, col]),
             }
 
         orbital_signals[constellation] = signals
@@ -203,8 +334,8 @@ def build_constellation_entry(name, definition):
     }
 
 
-def create_gnss_frequencies():
-    """Create the complete GNSS frequencies dictionary with calculated values."""
+def _build_gnss_frequencies():
+    """Build the complete GNSS frequencies dictionary with calculated values."""
     constellation_definitions = load_constellation_definitions()
     constellation_entries = {
         name: build_constellation_entry(name, definition)
@@ -222,15 +353,18 @@ def create_gnss_frequencies():
         "aliases": {},
     }
 
-    aliases = {}
-    for tide_name, tide_freq in TIDES.items():
-        aliases[f"{tide_name}_daily"] = calculate_alias_frequency(tide_freq, 1.0)
-        for constellation_name, constellation_data in constellation_entries.items():
-            aliases[f"{tide_name}_{constellation_name}"] = calculate_alias_frequency(
-                tide_freq,
-                constellation_data["ground_repeat_frequency"],
-            )
-    frequencies["aliases"] = aliases
+    tide_freqs = np.fromiter(TIDES.values(), dtype=np.float64)[:, np.newaxis]
+    reference_labels = ["daily", *constellation_entries]
+    reference_freqs = np.array(
+        [1.0] + [entry["ground_repeat_frequency"] for entry in constellation_entries.values()]
+    )
+    alias_matrix = np.abs(tide_freqs - np.round(tide_freqs / reference_freqs) * reference_freqs)
+
+    frequencies["aliases"] = {
+        f"{tide_name}_{label}": float(alias_matrix[row, col])
+        for row, tide_name in enumerate(TIDES)
+        for col, label in enumerate(reference_labels)
+    }
 
     orbital_signals = calculate_orbital_signals_table({
         name: data["satellite_revolution_period_hours"]
@@ -239,12 +373,24 @@ def create_gnss_frequencies():
     for constellation_name, signals in orbital_signals.items():
         frequencies[constellation_name]["orbital_signals"] = signals
 
-    return frequencies
+    return _freeze_mapping(frequencies)
+
+
+def create_gnss_frequencies():
+    """
+    Return the complete GNSS frequencies dictionary with calculated values.
+
+    The table is deterministic, so it is built once at import time and served
+    as a read-only mapping; use :func:`unfreeze_frequencies` to obtain a
+    mutable copy (e.g. for JSON serialization).
+    """
+    return GNSS_FREQUENCIES
 
 
-def get_frequency_summary():
+def get_frequency_summary(frequencies=None):
     """Get a summary of all available frequency categories."""
-    frequencies = create_gnss_frequencies()
+    if frequencies is None:
+        frequencies = create_gnss_frequencies()
     constellation_names = list(load_constellation_definitions().keys())
     non_frequency_keys = {
         "semi_major_axis_km",
@@ -258,24 +404,22 @@ def get_frequency_summary():
         "satellite_revolution_period_hours",
     }
 
-    def count_frequencies(data):
-        count = 0
-        for key, value in data.items():
-            if isinstance(value, dict):
-                count += count_frequencies(value)
-            elif isinstance(value, (int, float)) and value > 0 and str(key) not in non_frequency_keys:
-                count += 1
-        return count
-
-    def collect_frequencies(data, collected):
+    def iter_frequencies(data):
         for key, value in data.items():
-            if isinstance(value, dict):
-                collect_frequencies(value, collected)
+            if isinstance(value, Mapping):
+                yield from iter_frequencies(value)
             elif isinstance(value, (int, float)) and value > 0 and str(key) not in non_frequency_keys:
-                collected.append(value)
-
-    all_freqs = []
-    collect_frequencies(frequencies, all_freqs)
+                yield value
+
+    total_frequencies = 0
+    min_freq = math.inf
+    max_freq = -math.inf
+    for value in iter_frequencies(frequencies):
+        total_frequencies += 1
+        if value < min_freq:
+            min_freq = value
+        if value > max_freq:
+            max_freq = value
 
     categories = {
         name: {
@@ -290,12 +434,15 @@ def get_frequency_summary():
     categories["aliases"] = len(frequencies["aliases"])
 
     return {
-        "total_frequencies": count_frequencies(frequencies),
+        "total_frequencies": total_frequencies,
         "frequency_range": {
-            "min_cpd": min(all_freqs) if all_freqs else 0,
-            "max_cpd": max(all_freqs) if all_freqs else 0,
-            "min_period_days": cpd_to_days(max(all_freqs)) if all_freqs else 0,
-            "max_period_days": cpd_to_days(min(all_freqs)) if all_freqs else 0,
+            "min_cpd": min_freq if total_frequencies else 0,
+            "max_cpd": max_freq if total_frequencies else 0,
+            "min_period_days": cpd_to_days(max_freq) if total_frequencies else 0,
+            "max_period_days": cpd_to_days(min_freq) if total_frequencies else 0,
         },
         "categories": categories,
     }
+
+
+GNSS_FREQUENCIES = _build_gnss_frequencies()
@@ -4,16 +4,32 @@ GNSS Frequencies Calculator - Main Script
 """
 
 import csv
+import io
 import json
-import os
+import pickle
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder.
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; only the binary saver needs it.
+    msgpack = None
 
 from gnss_frequencies import (
     create_gnss_frequencies,
     cpd_to_days,
     get_frequency_summary,
     load_constellation_definitions,
+    unfreeze_frequencies,
 )
 
 if hasattr(sys.stdout, "reconfigure"):
@@ -21,7 +37,26 @@ if hasattr(sys.stdout, "reconfigure"):
     sys.stderr.reconfigure(encoding="utf-8")
 
 
-EXCLUDED_DETAIL_KEYS = {
+_BAR = "=" * 80
+_SUB = "-" * 40
+
+# Bound .format templates for the high-volume report rows; looking these up
+# once turns each row into a single C-level formatting call.
+_ROW = "{:30s}: {:12.7f} cpd ({:8.3f} days)".format
+_HARMONIC_ROW = ("    {:2d}f_d" + " " * 20 + ": {:12.7f} cpd ({:8.3f} days)").format
+_PEAK_ROW = "      {:<20s}: {:12.7f} cpd ({:8.3f} days)".format
+_SIGNAL_ROW = "    {:<12s}: {:12.7f} cpd ({:8.3f} {}) -> aliased: {:8.3f} days".format
+_ANNUAL_ROW = ("{:2d}f_annual" + " " * 18 + ": {:12.7f} cpd ({:8.3f} days)").format
+
+_JSON_ENCODER_COMPACT = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_JSON_ENCODER_PRETTY = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+# Bump the version whenever the build logic in gnss_frequencies changes so
+# stale pickles are ignored.
+_FREQ_CACHE_VERSION = 2
+_FREQ_CACHE_PATH = Path.home() / ".cache" / f"gnss_freq_v{_FREQ_CACHE_VERSION}.pkl"
+
+EXCLUDED_DETAIL_KEYS = frozenset({
     "display_name",
     "orbital_parameters",
     "repeat_cycle_days",
@@ -31,7 +66,35 @@ EXCLUDED_DETAIL_KEYS = {
     "orbital_signals",
     "satellite_revolution_period_days",
     "satellite_revolution_period_hours",
-}
+})
+
+
+def _reciprocals(values):
+    """Vectorized 1/x over a collection of frequencies (0 maps to inf)."""
+    freqs = np.fromiter(values, dtype=np.float64)
+    with np.errstate(divide="ignore"):
+        return np.where(freqs == 0.0, np.inf, 1.0 / freqs)
+
+
+def load_cached_frequencies(cache_path=_FREQ_CACHE_PATH):
+    """Return the frequency dictionary, reusing a pickled copy when available.
+
+    The build is pure arithmetic over the YAML definitions, so the result is
+    cached to disk once and deserialized on later runs. The cache stores the
+    plain (unfrozen) dict because MappingProxyType does not pickle.
+    """
+    try:
+        return pickle.loads(cache_path.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    frequencies = unfreeze_frequencies(create_gnss_frequencies())
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(pickle.dumps(frequencies, protocol=5))
+    except OSError:
+        pass  # Cache misses are only a performance issue, never an error.
+    return frequencies
 
 
 def get_constellation_names():
@@ -44,150 +107,224 @@ def get_constellation_labels(frequencies, constellation_names):
     return [frequencies[name]["display_name"] for name in constellation_names]
 
 
-def print_constellation_report(constellation):
-    """Print one constellation section."""
+def _row_lines(template, items, periods):
+    """Yield template-formatted rows with trailing newlines, for writelines."""
+    for (name, freq), period in zip(items, periods):
+        yield template(name, freq, period)
+        yield "\n"
+
+
+def _format_orbital_signals(signals):
+    """Format the orbital-signal rows for one constellation."""
+    rows = []
+    for signal_name, signal_data in signals.items():
+        freq_cpd = signal_data["frequency_cpd"]
+        orbital_period = signal_data["orbital_period_hours"]
+
+        if freq_cpd < 1.0:
+            orbital_period_display, period_unit = orbital_period / 24.0, "days"
+        else:
+            orbital_period_display, period_unit = orbital_period, "hrs"
+
+        rows.append(
+            _SIGNAL_ROW(
+                signal_name,
+                freq_cpd,
+                orbital_period_display,
+                period_unit,
+                signal_data["aliased_period_days"],
+            )
+        )
+    return rows
+
+
+def print_constellation_report(constellation, buf):
+    """Write one constellation section into the report buffer."""
     display_name = constellation["display_name"]
+    w = buf.write
 
-    print(f"{display_name.upper()} FREQUENCIES")
-    print("-" * 40)
+    w(f"{display_name.upper()} FREQUENCIES\n")
+    w(_SUB + "\n")
 
-    base_freqs = {key: value for key, value in constellation.items() if key not in EXCLUDED_DETAIL_KEYS}
-    for name, freq in base_freqs.items():
-        period = cpd_to_days(freq)
-        print(f"{name:30s}: {freq:12.7f} cpd ({period:8.3f} days)")
+    base_items = [item for item in constellation.items() if item[0] not in EXCLUDED_DETAIL_KEYS]
+    buf.writelines(_row_lines(_ROW, base_items, _reciprocals(freq for _, freq in base_items)))
 
-    print(
+    w(
         f"{'satellite_revolution_period':30s}: "
         f"{constellation['satellite_revolution_period_hours']:12.3f} hrs "
-        f"({constellation['satellite_revolution_period_days']:8.3f} days)"
+        f"({constellation['satellite_revolution_period_days']:8.3f} days)\n"
     )
-    print(
+    w(
         f"{'repeat_cycle_days':30s}: "
         f"{constellation['repeat_cycle_days']:12.3f} days "
-        f"({constellation['repeat_revolutions']:8.3f} rev)"
+        f"({constellation['repeat_revolutions']:8.3f} rev)\n"
     )
 
-    print(f"\n  {display_name} Draconitic Harmonics:")
-    for harmonic, freq in constellation["draconitic_harmonics"].items():
-        period = cpd_to_days(freq)
-        print(f"    {harmonic:2d}f_d{'':<20s}: {freq:12.7f} cpd ({period:8.3f} days)")
+    w(f"\n  {display_name} Draconitic Harmonics:\n")
+    harmonics = constellation["draconitic_harmonics"]
+    buf.writelines(_row_lines(_HARMONIC_ROW, harmonics.items(), _reciprocals(harmonics.values())))
 
-    print(f"\n  {display_name} Orbital Peaks (Rebischung et al. 2024 method):")
+    w(f"\n  {display_name} Orbital Peaks (Rebischung et al. 2024 method):\n")
     for category, peaks in constellation["orbital_peaks"].items():
-        print(f"    {category}:")
-        for peak_name, freq in peaks.items():
-            period = cpd_to_days(freq)
-            print(f"      {peak_name:<20s}: {freq:12.7f} cpd ({period:8.3f} days)")
+        w(f"    {category}:\n")
+        buf.writelines(_row_lines(_PEAK_ROW, peaks.items(), _reciprocals(peaks.values())))
 
-    print(f"\n  {display_name} Orbital Signals (Zajdel et al. 2022 method):")
-    for signal_name, signal_data in constellation["orbital_signals"].items():
-        orbital_period = signal_data["orbital_period_hours"]
-        freq_cpd = signal_data["frequency_cpd"]
-        aliased_period = signal_data["aliased_period_days"]
-
-        if freq_cpd < 1.0:
-            orbital_period_display = orbital_period / 24.0
-            period_unit = "days"
-        else:
-            orbital_period_display = orbital_period
-            period_unit = "hrs"
-
-        print(
-            f"    {signal_name:<12s}: {freq_cpd:12.7f} cpd "
-            f"({orbital_period_display:8.3f} {period_unit}) -> aliased: {aliased_period:8.3f} days"
-        )
-    print()
+    w(f"\n  {display_name} Orbital Signals (Zajdel et al. 2022 method):\n")
+    w("\n".join(_format_orbital_signals(constellation["orbital_signals"])))
+    w("\n\n")
 
 
-def print_frequency_report():
-    """Print comprehensive frequency report in organized format."""
-    frequencies = create_gnss_frequencies()
+def build_report_string(frequencies, summary):
+    """Assemble the comprehensive frequency report and return it as one string."""
     constellation_names = get_constellation_names()
 
-    print("=" * 80)
-    print("COMPREHENSIVE GNSS AND TIDAL FREQUENCY REPORT")
-    print("=" * 80)
-    print("All frequencies are given in cycles per day (cpd)")
-    print("Corresponding periods are shown in parentheses")
-    print()
-    print("References:")
-    print("- Zajdel et al. (2022): Orbital artifacts in multi-GNSS precise point positioning")
-    print("  time series. J. Geophys. Res. Solid Earth, 127(2), 19.")
-    print("- Rebischung et al. (2024): Analysis of the IGS contribution to ITRF2020.")
-    print("  Journal of Geodesy, 98(6), 49.")
-    print()
-
-    print("EARTH REFERENCE FREQUENCIES")
-    print("-" * 40)
-    for name, freq in frequencies["earth"].items():
-        period = cpd_to_days(freq)
-        print(f"{name:30s}: {freq:12.7f} cpd ({period:8.3f} days)")
-    print()
+    buf = io.StringIO()
+    w = buf.write
+
+    w(_BAR + "\n")
+    w("COMPREHENSIVE GNSS AND TIDAL FREQUENCY REPORT\n")
+    w(_BAR + "\n")
+    w("All frequencies are given in cycles per day (cpd)\n")
+    w("Corresponding periods are shown in parentheses\n")
+    w("\n")
+    w("References:\n")
+    w("- Zajdel et al. (2022): Orbital artifacts in multi-GNSS precise point positioning\n")
+    w("  time series. J. Geophys. Res. Solid Earth, 127(2), 19.\n")
+    w("- Rebischung et al. (2024): Analysis of the IGS contribution to ITRF2020.\n")
+    w("  Journal of Geodesy, 98(6), 49.\n")
+    w("\n")
+
+    w("EARTH REFERENCE FREQUENCIES\n")
+    w(_SUB + "\n")
+    earth = frequencies["earth"]
+    buf.writelines(_row_lines(_ROW, earth.items(), _reciprocals(earth.values())))
+    w("\n")
 
     for constellation_name in constellation_names:
-        print_constellation_report(frequencies[constellation_name])
-
-    print("TIDAL FREQUENCIES")
-    print("-" * 40)
-    for name, freq in frequencies["tides"].items():
-        period = cpd_to_days(freq)
-        print(f"{name:30s}: {freq:12.7f} cpd ({period:8.3f} days)")
-    print()
-
-    print("ANNUAL HARMONICS")
-    print("-" * 40)
-    for harmonic, freq in frequencies["annual"].items():
-        period = cpd_to_days(freq)
-        print(f"{harmonic:2d}f_annual{'':<18s}: {freq:12.7f} cpd ({period:8.3f} days)")
-    print()
-
-    print("ALIAS FREQUENCIES")
-    print("-" * 40)
-    for name, freq in sorted(frequencies["aliases"].items()):
-        period = cpd_to_days(freq)
-        print(f"{name:30s}: {freq:12.7f} cpd ({period:8.3f} days)")
-    print()
-
-    summary = get_frequency_summary()
-    print("SUMMARY STATISTICS")
-    print("-" * 40)
-    print(f"Total number of frequencies: {summary['total_frequencies']}")
-    print(
+        print_constellation_report(frequencies[constellation_name], buf)
+
+    w("TIDAL FREQUENCIES\n")
+    w(_SUB + "\n")
+    tides = frequencies["tides"]
+    buf.writelines(_row_lines(_ROW, tides.items(), _reciprocals(tides.values())))
+    w("\n")
+
+    w("ANNUAL HARMONICS\n")
+    w(_SUB + "\n")
+    annual = frequencies["annual"]
+    buf.writelines(_row_lines(_ANNUAL_ROW, annual.items(), _reciprocals(annual.values())))
+    w("\n")
+
+    w("ALIAS FREQUENCIES\n")
+    w(_SUB + "\n")
+    alias_items = sorted(frequencies["aliases"].items())
+    buf.writelines(_row_lines(_ROW, alias_items, _reciprocals(freq for _, freq in alias_items)))
+    w("\n")
+
+    w("SUMMARY STATISTICS\n")
+    w(_SUB + "\n")
+    w(f"Total number of frequencies: {summary['total_frequencies']}\n")
+    w(
         f"Frequency range: {summary['frequency_range']['min_cpd']:.7f} "
-        f"to {summary['frequency_range']['max_cpd']:.7f} cpd"
+        f"to {summary['frequency_range']['max_cpd']:.7f} cpd\n"
     )
-    print(
+    w(
         f"Period range: {summary['frequency_range']['min_period_days']:.3f} "
-        f"to {summary['frequency_range']['max_period_days']:.3f} days"
+        f"to {summary['frequency_range']['max_period_days']:.3f} days\n"
     )
 
-    print("\nFrequencies by category:")
+    w("\nFrequencies by category:\n")
+    # Constellation categories carry per-subcategory dicts; everything else
+    # is a plain count, so membership beats an isinstance check per row.
+    grouped_categories = frozenset(constellation_names)
     for category, counts in summary["categories"].items():
-        if isinstance(counts, dict):
+        if category in grouped_categories:
             total_cat = sum(counts.values())
-            print(f"  {category.upper()}: {total_cat} frequencies")
+            w(f"  {category.upper()}: {total_cat} frequencies\n")
             for subcategory, count in counts.items():
-                print(f"    {subcategory}: {count}")
+                w(f"    {subcategory}: {count}\n")
         else:
-            print(f"  {category.upper()}: {counts} frequencies")
+            w(f"  {category.upper()}: {counts} frequencies\n")
 
-    print("=" * 80)
+    w(_BAR + "\n")
 
+    return buf.getvalue()
 
-def save_frequencies_to_json(filename="gnss_frequencies.json"):
-    """Save the GNSS frequencies dictionary to a JSON file."""
-    frequencies = create_gnss_frequencies()
 
+def print_frequency_report(frequencies, summary, out=None):
+    """Print the comprehensive frequency report to ``out`` (stdout by default)."""
+    (out if out is not None else sys.stdout).write(build_report_string(frequencies, summary))
+
+
+def _write_frequencies_json(frequencies, filename, pretty):
+    """Serialize the frequency dictionary to ``filename`` and return the byte count."""
+    plain_frequencies = unfreeze_frequencies(frequencies)
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: the harmonic sub-dicts are keyed by int
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(plain_frequencies, option=option)
+        with open(filename, "wb") as file_handle:
+            file_handle.write(payload)
+            return file_handle.tell()
+    encoder = _JSON_ENCODER_PRETTY if pretty else _JSON_ENCODER_COMPACT
+    with open(filename, "w", encoding="utf-8") as file_handle:
+        # Stream encoder chunks straight to the file; no intermediate
+        # full-document string is built.
+        for chunk in encoder.iterencode(plain_frequencies):
+            file_handle.write(chunk)
+        return file_handle.tell()
+
+
+def _report_json_save(filename, result):
+    """Report the outcome of a JSON write; ``result`` yields the byte count."""
     try:
-        with open(filename, "w", encoding="utf-8") as file_handle:
-            json.dump(frequencies, file_handle, indent=2)
+        file_size = result()
+    except OSError as exc:
+        print(f"\nError saving JSON file: {exc}")
+        return False
+    print(f"\nGNSS frequencies dictionary saved to '{filename}'")
+    print(f"File size: {file_size:,} bytes ({file_size / 1024:.1f} KB)")
+    return True
+
+
+def save_frequencies_to_json(frequencies, filename="gnss_frequencies.json", pretty=False):
+    """
+    Save the GNSS frequencies dictionary to a JSON file.
+
+    The file is written compact by default since it is consumed with
+    json.load; pass pretty=True for an indented, human-readable dump.
+    """
+    return _report_json_save(
+        filename, lambda: _write_frequencies_json(frequencies, filename, pretty)
+    )
+
+
+def save_frequencies_to_msgpack(frequencies, filename="gnss_frequencies.msgpack"):
+    """
+    Save the GNSS frequencies dictionary to a msgpack file.
+
+    The binary encoding is both smaller and faster to parse than JSON;
+    read it back with ``msgpack.unpackb(raw, raw=False, strict_map_key=False)``
+    (the harmonic sub-dicts are keyed by int). Keep the JSON export for
+    human inspection.
+    """
+    if msgpack is None:
+        print("\nmsgpack is not installed; skipping binary export")
+        return False
+
+    try:
+        plain_frequencies = unfreeze_frequencies(frequencies)
+        with open(filename, "wb") as file_handle:
+            file_handle.write(msgpack.packb(plain_frequencies, use_bin_type=True))
+            file_size = file_handle.tell()
 
-        file_size = os.path.getsize(filename)
         print(f"\nGNSS frequencies dictionary saved to '{filename}'")
         print(f"File size: {file_size:,} bytes ({file_size / 1024:.1f} KB)")
         return True
-    except Exception as exc:
-        print(f"\nError saving JSON file: {exc}")
+    except OSError as exc:
+        print(f"\nError saving msgpack file: {exc}")
         return False
 
 
@@ -199,9 +336,8 @@ def _parse_rebischung_peak_name(peak_name):
     return int(match.group(1)), int(match.group(2))
 
 
-def save_rebischung_peaks_to_csv(filename="rebischung_orbital_peaks.csv"):
+def save_rebischung_peaks_to_csv(frequencies, filename="rebischung_orbital_peaks.csv"):
     """Save Rebischung orbital peaks for all configured constellations to a CSV file."""
-    frequencies = create_gnss_frequencies()
     constellation_names = get_constellation_names()
 
     try:
@@ -228,48 +364,70 @@ def save_rebischung_peaks_to_csv(filename="rebischung_orbital_peaks.csv"):
                         f"{cpd_to_days(freq_cpd):.3f}",
                     ])
 
-        file_size = os.path.getsize(filename)
+            file_size = file_handle.tell()
+
         print(f"\nRebischung orbital peaks saved to '{filename}'")
         print(f"File size: {file_size:,} bytes ({file_size / 1024:.1f} KB)")
         return True
-    except Exception as exc:
+    except OSError as exc:
         print(f"\nError saving Rebischung peaks CSV file: {exc}")
         return False
 
 
+_USAGE_TEXT = "\n" + "\n".join([
+    _BAR,
+    "USAGE EXAMPLES",
+    _BAR,
+    "1. Import and use the library:",
+    "   from gnss_frequencies import create_gnss_frequencies, cpd_to_days",
+    "   frequencies = create_gnss_frequencies()",
+    "   gps_draconitic = frequencies['gps']['draconitic_frequency']",
+    "",
+    "2. Calculate orbital periods:",
+    "   from gnss_frequencies import calculate_orbital_period",
+    "   period = calculate_orbital_period(n=-2, m=1, T_S=11.967, T_E=23.9345)",
+    "",
+    "3. Calculate subdaily aliasing:",
+    "   from gnss_frequencies import calculate_subdaily_aliasing",
+    "   aliased = calculate_subdaily_aliasing(freq_cpd=2.0057, sampling_interval_hours=24)",
+    "",
+    "4. Load saved frequencies from JSON:",
+    "   import json",
+    "   with open('gnss_frequencies.json', 'r') as f:",
+    "       loaded_frequencies = json.load(f)",
+    "",
+    "5. Get frequency summary:",
+    "   from gnss_frequencies import get_frequency_summary",
+    "   summary = get_frequency_summary()",
+    "   print(f'Total frequencies: {summary[\"total_frequencies\"]}')",
+    "",
+]) + "\n"
+
+_ANALYSIS_COMPLETE_TEXT = "\n" + "\n".join([
+    _BAR,
+    "ANALYSIS COMPLETE",
+    _BAR,
+    "Generated %d frequencies across all categories",
+    "Calculated orbital signals for %d GNSS constellations",
+    "Included %d annual harmonics",
+    "Computed %d alias frequencies",
+    "Saved complete database to gnss_frequencies.json",
+    "",
+    "Files created:",
+    "- gnss_frequencies.json",
+    "- rebischung_orbital_peaks.csv",
+]) + "\n"
+
+
 def print_usage_examples():
     """Print examples of how to use the library."""
-    print("\n" + "=" * 80)
-    print("USAGE EXAMPLES")
-    print("=" * 80)
-    print("1. Import and use the library:")
-    print("   from gnss_frequencies import create_gnss_frequencies, cpd_to_days")
-    print("   frequencies = create_gnss_frequencies()")
-    print("   gps_draconitic = frequencies['gps']['draconitic_frequency']")
-    print()
-    print("2. Calculate orbital periods:")
-    print("   from gnss_frequencies import calculate_orbital_period")
-    print("   period = calculate_orbital_period(n=-2, m=1, T_S=11.967, T_E=23.9345)")
-    print()
-    print("3. Calculate subdaily aliasing:")
-    print("   from gnss_frequencies import calculate_subdaily_aliasing")
-    print("   aliased = calculate_subdaily_aliasing(freq_cpd=2.0057, sampling_interval_hours=24)")
-    print()
-    print("4. Load saved frequencies from JSON:")
-    print("   import json")
-    print("   with open('gnss_frequencies.json', 'r') as f:")
-    print("       loaded_frequencies = json.load(f)")
-    print()
-    print("5. Get frequency summary:")
-    print("   from gnss_frequencies import get_frequency_summary")
-    print("   summary = get_frequency_summary()")
-    print("   print(f'Total frequencies: {summary[\"total_frequencies\"]}')")
-    print()
+    sys.stdout.write(_USAGE_TEXT)
 
 
 def main():
     """Run the full GNSS frequency analysis workflow."""
-    frequencies = create_gnss_frequencies()
+    frequencies = load_cached_frequencies()
+    summary = get_frequency_summary(frequencies)
     constellation_names = get_constellation_names()
     constellation_labels = get_constellation_labels(frequencies, constellation_names)
 
@@ -278,30 +436,30 @@ def main():
     print()
 
     print("Generating frequency report...")
-    print_frequency_report()
+    # The JSON write is I/O-bound and independent of the report formatting,
+    # so let it overlap with the string assembly in a worker thread.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        json_future = executor.submit(
+            _write_frequencies_json, frequencies, "gnss_frequencies.json", False
+        )
+        report_future = executor.submit(build_report_string, frequencies, summary)
+        sys.stdout.write(report_future.result())
 
-    print("\nSaving frequencies to JSON file...")
-    json_success = save_frequencies_to_json()
+        print("\nSaving frequencies to JSON file...")
+        json_success = _report_json_save("gnss_frequencies.json", json_future.result)
 
     print("\nSaving Rebischung orbital peaks to CSV file...")
-    csv_success = save_rebischung_peaks_to_csv()
+    csv_success = save_rebischung_peaks_to_csv(frequencies)
 
     if json_success and csv_success:
         print_usage_examples()
 
-        summary = get_frequency_summary()
-        print("\n" + "=" * 80)
-        print("ANALYSIS COMPLETE")
-        print("=" * 80)
-        print(f"Generated {summary['total_frequencies']} frequencies across all categories")
-        print(f"Calculated orbital signals for {len(constellation_names)} GNSS constellations")
-        print(f"Included {summary['categories']['annual']} annual harmonics")
-        print(f"Computed {summary['categories']['aliases']} alias frequencies")
-        print("Saved complete database to gnss_frequencies.json")
-        print()
-        print("Files created:")
-        print("- gnss_frequencies.json")
-        print("- rebischung_orbital_peaks.csv")
+        sys.stdout.write(_ANALYSIS_COMPLETE_TEXT % (
+            summary['total_frequencies'],
+            len(constellation_names),
+            summary['categories']['annual'],
+            summary['categories']['aliases'],
+        ))
     else:
         print("Error occurred during processing")
 